@@ -0,0 +1,56 @@
+"""grants_org_type_jsonb_gin
+
+Revision ID: 3c9e5a1f7b20
+Revises: 8eac3573d2af
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e5a1f7b20'
+down_revision: Union[str, None] = '8eac3573d2af'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # Switch org_type_eligible to JSONB so it can be GIN indexed
+    op.alter_column('grants', 'org_type_eligible',
+               existing_type=postgresql.JSON(astext_type=sa.Text()),
+               type_=postgresql.JSONB(astext_type=sa.Text()),
+               existing_nullable=True,
+               postgresql_using='org_type_eligible::jsonb')
+
+    # Lowercase existing values to match the model's write-side normalization
+    op.execute("""
+        UPDATE grants
+        SET org_type_eligible = (
+            SELECT COALESCE(jsonb_agg(lower(value)), '[]'::jsonb)
+            FROM jsonb_array_elements_text(org_type_eligible)
+        )
+        WHERE jsonb_typeof(org_type_eligible) = 'array'
+    """)
+
+    op.create_index('ix_grants_org_type_eligible', 'grants', ['org_type_eligible'],
+                    unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_grants_org_type_eligible', table_name='grants')
+    op.alter_column('grants', 'org_type_eligible',
+               existing_type=postgresql.JSONB(astext_type=sa.Text()),
+               type_=postgresql.JSON(astext_type=sa.Text()),
+               existing_nullable=True,
+               postgresql_using='org_type_eligible::json')
@@ -0,0 +1,27 @@
+"""grants_filters_composite_index
+
+Revision ID: 5d2b7e8c9a41
+Revises: 3c9e5a1f7b20
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2b7e8c9a41'
+down_revision: Union[str, None] = '3c9e5a1f7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Composite index for the grant list's combined status/industry/location filters
+    op.create_index('ix_grants_filters', 'grants',
+                    ['status', 'industry_focus', 'location_eligibility'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_grants_filters', table_name='grants')
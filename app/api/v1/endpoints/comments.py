@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, raiseload, selectinload
 from typing import List, Dict
 from datetime import datetime
 
@@ -69,28 +70,37 @@ async def create_comment(
         reactions=db_comment.reaction_summary
     )
 
-@router.get("/task/{task_id}", response_model=List[TaskCommentResponse])
+# The items are built from trusted rows, so they are returned as an ORJSONResponse
+# instead of being re-validated through TaskCommentResponse; the model still documents them
+@router.get("/task/{task_id}", responses={200: {"model": List[TaskCommentResponse]}})
 async def get_task_comments(
     task_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all comments for a task."""
-    comments = db.query(TaskComment).filter(TaskComment.task_id == task_id).all()
-    return [
-        TaskCommentResponse(
-            id=comment.id,
-            content=comment.content,
-            task_id=comment.task_id,
-            user_id=comment.user_id,
-            parent_id=comment.parent_id,
-            mentions=comment.mentions or [],
-            created_at=comment.created_at,
-            updated_at=comment.updated_at,
-            reactions=comment.reaction_summary
-        )
+    # Reactions feed reaction_summary, so load them for all comments in one
+    # IN query; any other relationship access would be an N+1 and raises
+    comments = (
+        db.query(TaskComment)
+        .options(selectinload(TaskComment.reactions), raiseload("*"))
+        .filter(TaskComment.task_id == task_id)
+        .all()
+    )
+    return ORJSONResponse([
+        {
+            "id": comment.id,
+            "content": comment.content,
+            "task_id": comment.task_id,
+            "user_id": comment.user_id,
+            "parent_id": comment.parent_id,
+            "mentions": comment.mentions or [],
+            "created_at": comment.created_at,
+            "updated_at": comment.updated_at,
+            "reactions": comment.reaction_summary
+        }
         for comment in comments
-    ]
+    ])
 
 @router.put("/{comment_id}", response_model=TaskCommentResponse)
 async def update_comment(
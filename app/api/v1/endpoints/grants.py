@@ -1,439 +1,581 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+import base64
+import binascii
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+import orjson
+from sqlalchemy import Float, Text, cast, exists, func, lambda_stmt, select, text, type_coerce
 from sqlalchemy.orm import Session
+from app.core.cache import ttl_cache
 from app.core.deps import get_db
+from app.db.session import get_engine
 from app.models.grant import Grant
 from app.schemas.grant import GrantResponse, GrantList
 # from app.services.scrapers.scraper_service import ScraperService  # Disabled - requires bs4
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
-# Industry focus options
-INDUSTRY_FOCUS_OPTIONS = [
+# Filter values accepted by the list endpoints; FastAPI validates Literal
+# parameters with the compiled schema instead of scanning a list per request
+IndustryFocus = Literal[
     "technology", "healthcare", "education", "environment",
     "agriculture", "manufacturing", "services", "research", "other"
 ]
 
-# Location eligibility options
-LOCATION_ELIGIBILITY_OPTIONS = [
-    "national", "state", "regional", "local", "international"
-]
+LocationEligibility = Literal["national", "state", "regional", "local", "international"]
 
-# Organization type options
-ORG_TYPE_OPTIONS = [
-    "startup", "sme", "enterprise", "nonprofit", "government", "academic", "any"
-]
+OrgType = Literal["startup", "sme", "enterprise", "nonprofit", "government", "academic", "any"]
+
+GrantStatus = Literal["open", "closed", "draft", "active"]
+
+# Static responses while grant scraping is disabled, encoded once at import
+SOURCES_DISABLED_RESPONSE = orjson.dumps({
+    "sources": [],
+    "total": 0,
+    "status": "disabled",
+    "message": "Grant scraping sources are currently disabled to reduce dependencies"
+})
+
+def _etag(body: bytes) -> str:
+    """Strong ETag for an encoded response body."""
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+def _conditional_response(body: bytes, etag: str, if_none_match: Optional[str]) -> Response:
+    """Return 304 when the client already holds ``etag``, else the body tagged with it."""
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+SOURCES_DISABLED_ETAG = _etag(SOURCES_DISABLED_RESPONSE)
+
+SCRAPE_ALL_DISABLED_RESPONSE = orjson.dumps({
+    "status": "disabled",
+    "message": "Grant scraping is currently disabled to reduce dependencies",
+    "available_sources": []
+})
+
+# Rows fetched per server-side cursor round trip when streaming /export
+GRANT_YIELD_PER = 200
+
+def _filter_grants(stmt, source, industry_focus, location, org_type, status):
+    """Append the optional list filters to a grant lambda statement.
+
+    Each filter is its own lambda, so SQLAlchemy caches one compiled statement
+    per filter combination and binds the filter values as parameters.
+    """
+    if source:
+        stmt += lambda s: s.where(Grant.source == source)
+    
+    if industry_focus:
+        stmt += lambda s: s.where(Grant.industry_focus == industry_focus)
+        
+    if location:
+        stmt += lambda s: s.where(Grant.location_eligibility == location)
+        
+    if org_type:
+        # JSONB "?" key-existence check, served by the GIN index on the column.
+        # The operand is coerced to Text so it binds as a plain string rather
+        # than being JSON-encoded by the column's type.
+        stmt += lambda s: s.where(Grant.org_type_eligible.op("?")(type_coerce(org_type, Text)))
+        
+    if status:
+        stmt += lambda s: s.where(Grant.status == status)
+    
+    return stmt
+
+@ttl_cache(ttl=30)
+def _count_filtered_grants(source, industry_focus, location, org_type, status) -> int:
+    """Count grants matching the list filters, cached per filter combination."""
+    stmt = _filter_grants(lambda_stmt(lambda: select(func.count()).select_from(Grant)),
+                          source, industry_focus, location, org_type, status)
+    with get_engine().connect() as conn:
+        return conn.execute(stmt).scalar()
+
+def _encode_cursor(grant_id: int) -> str:
+    """Encode the last grant id of a page as an opaque cursor."""
+    return base64.urlsafe_b64encode(str(grant_id).encode()).decode()
+
+def _decode_cursor(cursor: str) -> int:
+    """Decode a cursor produced by _encode_cursor back into a grant id."""
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+# Columns returned by the list endpoints, selected directly so rows skip ORM
+# hydration. Amounts are cast to float in SQL so rows carry no Decimals.
+GRANT_COLUMNS = (
+    Grant.id, Grant.title, Grant.description, Grant.source, Grant.source_url,
+    Grant.application_url, Grant.contact_email,
+    cast(Grant.min_amount, Float).label("min_amount"),
+    cast(Grant.max_amount, Float).label("max_amount"),
+    Grant.open_date, Grant.deadline, Grant.industry_focus, Grant.location_eligibility,
+    Grant.org_type_eligible, Grant.funding_purpose, Grant.audience_tags, Grant.status,
+    Grant.notes, Grant.created_at, Grant.updated_at
+)
+GRANT_COLUMNS_BY_FIELD = {column.key: column for column in GRANT_COLUMNS}
+
+# JSON array columns, returned as [] rather than null
+GRANT_LIST_FIELDS = ("org_type_eligible", "funding_purpose", "audience_tags")
+
+@dataclass(slots=True)
+class GrantItem:
+    """A grant list row, with fields in ``GRANT_COLUMNS`` order.
+
+    orjson serializes slotted dataclasses natively; datetimes and None are
+    encoded as-is, and the list columns are defaulted so clients always
+    receive arrays.
+    """
+    id: int
+    title: str
+    description: Optional[str]
+    source: str
+    source_url: Optional[str]
+    application_url: Optional[str]
+    contact_email: Optional[str]
+    min_amount: Optional[float]
+    max_amount: Optional[float]
+    open_date: Optional[datetime]
+    deadline: Optional[datetime]
+    industry_focus: Optional[str]
+    location_eligibility: Optional[str]
+    org_type_eligible: Optional[List[str]]
+    funding_purpose: Optional[List[str]]
+    audience_tags: Optional[List[str]]
+    status: str
+    notes: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+
+    def __post_init__(self):
+        for name in GRANT_LIST_FIELDS:
+            if getattr(self, name) is None:
+                setattr(self, name, [])
 
-@router.get("/", response_model=GrantList)
+GRANT_FIELD_NAMES = tuple(GRANT_COLUMNS_BY_FIELD)
+
+def _select_fields(fields: Optional[str]) -> tuple:
+    """Resolve a comma-separated ``fields`` selector to grant field names.
+
+    Names keep their ``GRANT_COLUMNS`` order so each selection compiles to a
+    single cached statement, and ``id`` is always included for the cursor.
+    """
+    if not fields:
+        return GRANT_FIELD_NAMES
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - GRANT_COLUMNS_BY_FIELD.keys()
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    requested.add("id")
+    return tuple(name for name in GRANT_FIELD_NAMES if name in requested)
+
+@ttl_cache(ttl=15, maxsize=256)
+def _grant_page(field_names, filters, last_id, skip, limit, include_total) -> tuple:
+    """Fetch and encode one page of the grant list, cached for 15 seconds.
+
+    Returns the encoded body and its ETag. Cache hits return both without
+    checking out a connection; grant writes in this module clear the cache
+    through ``_invalidate_grant_caches``.
+    """
+    total = _count_filtered_grants(*filters) if include_total else None
+    if field_names == GRANT_FIELD_NAMES:
+        columns = GRANT_COLUMNS
+    else:
+        columns = tuple(GRANT_COLUMNS_BY_FIELD[name] for name in field_names)
+    
+    # Fetch one extra row to learn whether another page follows
+    stmt = _filter_grants(lambda_stmt(lambda: select(*columns)), *filters)
+    if last_id is not None:
+        stmt += lambda s: s.where(Grant.id < last_id)
+    else:
+        stmt += lambda s: s.offset(skip)
+    stmt += lambda s: s.order_by(Grant.id.desc()).limit(limit + 1)
+    
+    with get_engine().connect() as conn:
+        rows = conn.execute(stmt).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+    if columns is GRANT_COLUMNS:
+        grant_items = [GrantItem(*row) for row in rows]
+    else:
+        grant_items = [row._asdict() for row in rows]
+        list_fields = [name for name in field_names if name in GRANT_LIST_FIELDS]
+        for item in grant_items:
+            for name in list_fields:
+                if item[name] is None:
+                    item[name] = []
+    
+    body = orjson.dumps({
+        "items": grant_items,
+        "total": total,
+        "page": skip // limit + 1 if last_id is None else None,
+        "size": limit,
+        "has_next": has_next,
+        "has_prev": last_id is not None or skip > 0,
+        "next_cursor": _encode_cursor(rows[-1].id) if has_next else None
+    })
+    return body, _etag(body)
+
+def _invalidate_grant_caches() -> None:
+    """Drop cached grant pages and counts after the grants table changes."""
+    _grant_page.cache_clear()
+    _count_filtered_grants.cache_clear()
+    _count_grants.cache_clear()
+
+# The items are built from trusted DB rows, so the encoded page is returned
+# as-is rather than re-validated through GrantList; the model still documents it.
+@router.get("/", responses={200: {"model": GrantList}})
 def get_grants(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0, le=10000),
+    limit: int = Query(100, ge=1, le=200),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    fields: Optional[str] = None,
     source: Optional[str] = None,
-    industry_focus: Optional[str] = Query(None, enum=INDUSTRY_FOCUS_OPTIONS),
-    location: Optional[str] = Query(None, enum=LOCATION_ELIGIBILITY_OPTIONS),
-    org_type: Optional[str] = Query(None, enum=ORG_TYPE_OPTIONS),
-    status: Optional[str] = Query(None, enum=["open", "closed", "draft", "active"])
+    industry_focus: Optional[IndustryFocus] = None,
+    location: Optional[LocationEligibility] = None,
+    org_type: Optional[OrgType] = None,
+    status: Optional[GrantStatus] = None,
+    if_none_match: Optional[str] = Header(None)
 ):
-    """Get list of grants with optional filtering."""
-    try:
-        # Use direct engine access with SQLAlchemy ORM
-        from app.db.session import get_engine
-        from sqlalchemy.orm import sessionmaker
-        from app.models.grant import Grant
-        from sqlalchemy import and_, or_
-        
-        engine = get_engine()
-        SessionLocal = sessionmaker(bind=engine)
-        db = SessionLocal()
-        
-        try:
-            # Build query with filters
-            query = db.query(Grant)
-            
-            if source:
-                query = query.filter(Grant.source == source)
-            
-            if industry_focus:
-                query = query.filter(Grant.industry_focus == industry_focus)
-                
-            if location:
-                query = query.filter(Grant.location_eligibility == location)
-                
-            if org_type:
-                query = query.filter(Grant.org_type_eligible.contains([org_type]))
-                
-            if status:
-                query = query.filter(Grant.status == status)
-            
-            # Get total count
-            total = query.count()
-            
-            # Apply pagination
-            grants = query.offset(skip).limit(limit).all()
-            
-            # Convert to response format
-            grant_items = []
-            for grant in grants:
-                grant_items.append({
-                    "id": grant.id,
-                    "title": grant.title,
-                    "description": grant.description,
-                    "source": grant.source,
-                    "source_url": grant.source_url,
-                    "application_url": grant.application_url,
-                    "contact_email": grant.contact_email,
-                    "min_amount": float(grant.min_amount) if grant.min_amount else None,
-                    "max_amount": float(grant.max_amount) if grant.max_amount else None,
-                    "open_date": grant.open_date.isoformat() if grant.open_date else None,
-                    "deadline": grant.deadline.isoformat() if grant.deadline else None,
-                    "industry_focus": grant.industry_focus,
-                    "location_eligibility": grant.location_eligibility,
-                    "org_type_eligible": grant.org_type_eligible or [],
-                    "funding_purpose": grant.funding_purpose or [],
-                    "audience_tags": grant.audience_tags or [],
-                    "status": grant.status,
-                    "notes": grant.notes,
-                    "created_at": grant.created_at.isoformat() if grant.created_at else None,
-                    "updated_at": grant.updated_at.isoformat() if grant.updated_at else None
-                })
-            
-            return GrantList(
-                items=grant_items,
-                total=total,
-                page=skip // limit + 1,
-                size=limit,
-                has_next=skip + limit < total,
-                has_prev=skip > 0
-            )
-            
-        finally:
-            db.close()
-            
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error fetching grants: {str(e)}"
-        )
+    """Get list of grants with optional filtering.
 
-@router.post("/scrape")
-async def scrape_all_sources(
-    background_tasks: BackgroundTasks,
+    Grants are returned newest first. Pass the ``next_cursor`` of a page as
+    ``cursor`` to fetch the following page with an index seek on the primary
+    key; ``skip`` is still honoured when no cursor is given but is deprecated,
+    as deep offsets make the database scan and discard every skipped row.
+    ``total`` is only computed when ``include_total`` is set, and is then
+    cached for 30 seconds per filter combination. ``fields`` (e.g.
+    ``id,title,deadline``) limits the columns read and returned. Pages are
+    cached for 15 seconds per parameter combination and carry an ``ETag``;
+    a matching ``If-None-Match`` gets an empty 304 response.
+    """
+    last_id = _decode_cursor(cursor) if cursor else None
+    filters = (source, industry_focus, location, org_type, status)
+    body, etag = _grant_page(_select_fields(fields), filters, last_id, skip, limit, include_total)
+    return _conditional_response(body, etag, if_none_match)
+
+@router.get("/export")
+def export_grants(
+    source: Optional[str] = None,
+    industry_focus: Optional[IndustryFocus] = None,
+    location: Optional[LocationEligibility] = None,
+    org_type: Optional[OrgType] = None,
+    status: Optional[GrantStatus] = None,
     db: Session = Depends(get_db)
 ):
+    """Stream every matching grant as a JSON array without buffering the full result."""
+    stmt = _filter_grants(lambda_stmt(lambda: select(*GRANT_COLUMNS)), source, industry_focus, location, org_type, status)
+    
+    def generate():
+        yield b"["
+        result = db.execute(stmt, execution_options={"yield_per": GRANT_YIELD_PER})
+        separator = b""
+        # Encode each fetched batch in one orjson call, stripping its brackets
+        for partition in result.partitions():
+            yield separator + orjson.dumps([GrantItem(*row) for row in partition])[1:-1]
+            separator = b","
+        yield b"]"
+    
+    return StreamingResponse(generate(), media_type="application/json")
+
+@router.post("/scrape")
+async def scrape_all_sources():
     """Trigger scraping of all available grant sources."""
-    return {
+    return Response(SCRAPE_ALL_DISABLED_RESPONSE, media_type="application/json")
+
+@lru_cache(maxsize=32)
+def _scrape_source_disabled_response(source: str) -> bytes:
+    """Encode the disabled response for a source once and reuse it."""
+    return orjson.dumps({
         "status": "disabled",
-        "message": "Grant scraping is currently disabled to reduce dependencies",
-        "available_sources": []
-    }
+        "message": f"Grant scraping for {source} is currently disabled to reduce dependencies"
+    })
 
 @router.post("/scrape/{source}")
-async def scrape_specific_source(
-    source: str,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
-):
+async def scrape_specific_source(source: str):
     """Trigger scraping of a specific grant source."""
-    return {
-        "status": "disabled",
-        "message": f"Grant scraping for {source} is currently disabled to reduce dependencies"
-    }
+    return Response(_scrape_source_disabled_response(source), media_type="application/json")
 
 @router.get("/sources")
-def get_available_sources(db: Session = Depends(get_db)):
+async def get_available_sources(if_none_match: Optional[str] = Header(None)):
     """Get list of available grant sources with their status."""
-    return {
-        "sources": [],
-        "total": 0,
-        "status": "disabled",
-        "message": "Grant scraping sources are currently disabled to reduce dependencies"
-    }
+    return _conditional_response(SOURCES_DISABLED_RESPONSE, SOURCES_DISABLED_ETAG, if_none_match)
+
+# Planner row estimate; O(1) catalog lookup instead of a table scan. A table that
+# has never been vacuumed or analyzed reports -1 (0 before Postgres 14), and small
+# tables are cheap to count exactly, so below the threshold COUNT(*) is used instead.
+GRANT_COUNT_ESTIMATE_MIN = 1000
+GRANT_COUNT_ESTIMATE_SQL = text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'grants'::regclass")
+GRANT_COUNT_SQL = text("SELECT COUNT(*) FROM grants")
+
+@ttl_cache(ttl=60)
+def _count_grants() -> int:
+    """Count grants over a pooled engine connection, cached so monitors don't hammer the DB.
+
+    On Postgres this is the planner's estimate rather than an exact count once the
+    estimate reaches GRANT_COUNT_ESTIMATE_MIN rows.
+    """
+    with get_engine().connect() as conn:
+        if conn.dialect.name == "postgresql":
+            estimate = conn.execute(GRANT_COUNT_ESTIMATE_SQL).scalar()
+            if estimate is not None and estimate >= GRANT_COUNT_ESTIMATE_MIN:
+                return estimate
+        return conn.execute(GRANT_COUNT_SQL).scalar()
+
+@router.get("/count")
+def count_grants():
+    """Get the total number of grants.
+
+    Cached for 60 seconds. On Postgres tables of GRANT_COUNT_ESTIMATE_MIN rows or
+    more this is the planner's row estimate; use
+    ``include_total`` on the list endpoint for an exact filtered count.
+    """
+    return {"total": _count_grants()}
 
 @router.get("/test")
 def test_grants():
     """Test endpoint that doesn't use dependency injection."""
-    try:
-        from app.db.session import get_engine
-        from sqlalchemy import text
-        
-        engine = get_engine()
-        with engine.connect() as conn:
-            # Check if grants table exists
-            result = conn.execute(text("SELECT COUNT(*) FROM grants"))
-            count = result.scalar()
-            
-        return {
-            "status": "success",
-            "grants_count": count,
-            "message": "Direct database access working"
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e),
-            "message": "Direct database access failed"
-        }
+    count = _count_grants()
+    
+    return {
+        "status": "success",
+        "grants_count": count,
+        "message": "Direct database access working"
+    }
 
 @router.post("/add-test")
-def add_test_grant():
+def add_test_grant(db: Session = Depends(get_db)):
     """Add a single test grant to the database."""
-    try:
-        from app.db.session import get_engine
-        from sqlalchemy.orm import sessionmaker
-        from app.models.grant import Grant
-        from datetime import datetime, timedelta
-        
-        engine = get_engine()
-        SessionLocal = sessionmaker(bind=engine)
-        db = SessionLocal()
-        
-        try:
-            # Create a simple test grant
-            test_grant = Grant(
-                title="Test Community Grant",
-                description="A test grant for community development",
-                source="Test Foundation",
-                source_url="https://example.com/test",
-                application_url="https://example.com/apply",
-                contact_email="test@example.com",
-                min_amount=1000.00,
-                max_amount=10000.00,
-                open_date=datetime.now(),
-                deadline=datetime.now() + timedelta(days=30),
-                industry_focus="community",
-                location_eligibility="local",
-                org_type_eligible=["nonprofit"],
-                funding_purpose=["community development"],
-                audience_tags=["community organizations"],
-                status="open"
-            )
-            
-            db.add(test_grant)
-            db.commit()
-            
-            return {
-                "status": "success",
-                "message": "Added test grant",
-                "grant_id": test_grant.id
-            }
-            
-        finally:
-            db.close()
-            
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e),
-            "message": "Failed to add test grant"
-        }
+    # Create a simple test grant
+    test_grant = Grant(
+        title="Test Community Grant",
+        description="A test grant for community development",
+        source="Test Foundation",
+        source_url="https://example.com/test",
+        application_url="https://example.com/apply",
+        contact_email="test@example.com",
+        min_amount=1000.00,
+        max_amount=10000.00,
+        open_date=datetime.now(),
+        deadline=datetime.now() + timedelta(days=30),
+        industry_focus="community",
+        location_eligibility="local",
+        org_type_eligible=["nonprofit"],
+        funding_purpose=["community development"],
+        audience_tags=["community organizations"],
+        status="open"
+    )
+    
+    db.add(test_grant)
+    db.commit()
+    _invalidate_grant_caches()
+    
+    return {
+        "status": "success",
+        "message": "Added test grant",
+        "grant_id": test_grant.id
+    }
 
 @router.post("/clear")
-def clear_all_grants():
+def clear_all_grants(db: Session = Depends(get_db)):
     """Clear all grants from the database."""
-    db = next(get_db())
+    # Delete all grants
+    deleted_count = db.query(Grant).delete()
+    db.commit()
+    _invalidate_grant_caches()
     
-    try:
-        # Delete all grants
-        deleted_count = db.query(Grant).delete()
-        db.commit()
-        
-        return {
-            "message": f"Successfully cleared {deleted_count} grants from the database",
-            "grants_deleted": deleted_count
-        }
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Error clearing grants: {str(e)}")
-    finally:
-        db.close()
+    return {
+        "message": f"Successfully cleared {deleted_count} grants from the database",
+        "grants_deleted": deleted_count
+    }
+
+# Sample grants for /seed-simple. Dates are relative: each row opens at seed
+# time and closes ``deadline_days`` later.
+SAMPLE_GRANT_TEMPLATES = (
+    # MEDIA SECTOR
+    {
+        "title": "Digital Media Innovation Fund",
+        "description": "Supporting innovative digital media projects that push creative boundaries and engage new audiences through technology.",
+        "source": "Creative Australia",
+        "source_url": "https://creative.gov.au",
+        "application_url": "https://creative.gov.au/apply",
+        "contact_email": "grants@creative.gov.au",
+        "min_amount": 50000,
+        "max_amount": 200000,
+        "deadline_days": 45,
+        "industry_focus": "technology",
+        "location_eligibility": "National",
+        "org_type_eligible": ["startup", "sme", "nonprofit"],
+        "funding_purpose": ["Digital Media", "Innovation"],
+        "audience_tags": ["Digital Creators", "Tech Startups"],
+        "status": "open",
+        "notes": "Focus on digital storytelling"
+    },
+    {
+        "title": "Indigenous Film Production Grant",
+        "description": "Supporting Indigenous filmmakers to tell authentic stories and preserve cultural heritage through film.",
+        "source": "Screen Australia",
+        "source_url": "https://screenaustralia.gov.au",
+        "application_url": "https://screenaustralia.gov.au/indigenous",
+        "contact_email": "indigenous@screenaustralia.gov.au",
+        "min_amount": 25000,
+        "max_amount": 150000,
+        "deadline_days": 30,
+        "industry_focus": "services",
+        "location_eligibility": "National",
+        "org_type_eligible": ["indigenous business", "nonprofit"],
+        "funding_purpose": ["Film Production", "Cultural Preservation"],
+        "audience_tags": ["Indigenous Communities", "Filmmakers"],
+        "status": "open",
+        "notes": "Priority for Indigenous-owned companies"
+    },
+    
+    # COMMUNITY SECTOR
+    {
+        "title": "Youth Mental Health Initiative",
+        "description": "Supporting community organizations to provide mental health services and support programs for young people.",
+        "source": "Department of Health",
+        "source_url": "https://health.gov.au",
+        "application_url": "https://health.gov.au/youth-mental-health",
+        "contact_email": "youth.health@health.gov.au",
+        "min_amount": 50000,
+        "max_amount": 500000,
+        "deadline_days": 75,
+        "industry_focus": "healthcare",
+        "location_eligibility": "National",
+        "org_type_eligible": ["nonprofit", "healthcare provider"],
+        "funding_purpose": ["Mental Health", "Youth Services"],
+        "audience_tags": ["Youth", "Mental Health Professionals"],
+        "status": "open",
+        "notes": "Priority for evidence-based programs"
+    },
+    {
+        "title": "Social Enterprise Accelerator",
+        "description": "Supporting social enterprises to scale their impact and create sustainable business models.",
+        "source": "Social Traders",
+        "source_url": "https://socialtraders.com.au",
+        "application_url": "https://socialtraders.com.au/accelerator",
+        "contact_email": "accelerator@socialtraders.com.au",
+        "min_amount": 25000,
+        "max_amount": 150000,
+        "deadline_days": 30,
+        "industry_focus": "services",
+        "location_eligibility": "National",
+        "org_type_eligible": ["social enterprise", "nonprofit"],
+        "funding_purpose": ["Social Enterprise", "Business Development"],
+        "audience_tags": ["Social Entrepreneurs", "Nonprofits"],
+        "status": "open",
+        "notes": "Must have proven social impact model"
+    },
+    
+    # SUSTAINABILITY SECTOR
+    {
+        "title": "Renewable Energy Innovation Grant",
+        "description": "Supporting innovative renewable energy projects that can accelerate Australia's transition to clean energy.",
+        "source": "Australian Renewable Energy Agency",
+        "source_url": "https://arena.gov.au",
+        "application_url": "https://arena.gov.au/innovation",
+        "contact_email": "innovation@arena.gov.au",
+        "min_amount": 100000,
+        "max_amount": 2000000,
+        "deadline_days": 120,
+        "industry_focus": "technology",
+        "location_eligibility": "National",
+        "org_type_eligible": ["startup", "sme", "research institution"],
+        "funding_purpose": ["Renewable Energy", "Innovation"],
+        "audience_tags": ["Energy Companies", "Researchers"],
+        "status": "open",
+        "notes": "Must demonstrate commercial potential"
+    },
+    {
+        "title": "Circular Economy Solutions",
+        "description": "Supporting businesses to develop circular economy solutions that reduce waste and create sustainable value chains.",
+        "source": "Circular Economy Australia",
+        "source_url": "https://circulareconomy.org.au",
+        "application_url": "https://circulareconomy.org.au/solutions-fund",
+        "contact_email": "solutions@circulareconomy.org.au",
+        "min_amount": 25000,
+        "max_amount": 300000,
+        "deadline_days": 75,
+        "industry_focus": "manufacturing",
+        "location_eligibility": "National",
+        "org_type_eligible": ["startup", "sme", "nonprofit"],
+        "funding_purpose": ["Circular Economy", "Waste Reduction"],
+        "audience_tags": ["Manufacturers", "Sustainability Experts"],
+        "status": "open",
+        "notes": "Focus on scalable circular economy models"
+    },
+    {
+        "title": "Sustainable Agriculture Innovation",
+        "description": "Supporting farmers to adopt sustainable practices and reduce environmental impact.",
+        "source": "Department of Agriculture",
+        "source_url": "https://agriculture.gov.au",
+        "application_url": "https://agriculture.gov.au/sustainable-ag",
+        "contact_email": "sustainable.ag@agriculture.gov.au",
+        "min_amount": 50000,
+        "max_amount": 500000,
+        "deadline_days": 90,
+        "industry_focus": "agriculture",
+        "location_eligibility": "Regional",
+        "org_type_eligible": ["sme", "farmer", "research institution"],
+        "funding_purpose": ["Sustainable Agriculture", "Innovation"],
+        "audience_tags": ["Farmers", "Agricultural Researchers"],
+        "status": "active",
+        "notes": "Must demonstrate environmental benefits"
+    },
+    {
+        "title": "Marine Conservation Initiative",
+        "description": "Supporting marine conservation projects that protect Australia's unique marine ecosystems.",
+        "source": "Great Barrier Reef Foundation",
+        "source_url": "https://barrierreef.org",
+        "application_url": "https://barrierreef.org/conservation",
+        "contact_email": "conservation@barrierreef.org",
+        "min_amount": 25000,
+        "max_amount": 250000,
+        "deadline_days": 45,
+        "industry_focus": "environment",
+        "location_eligibility": "Coastal",
+        "org_type_eligible": ["nonprofit", "research institution"],
+        "funding_purpose": ["Marine Conservation", "Biodiversity"],
+        "audience_tags": ["Marine Biologists", "Conservationists"],
+        "status": "open",
+        "notes": "Priority for Great Barrier Reef projects"
+    }
+)
 
 @router.post("/seed-simple")
-def seed_simple_grants():
+def seed_simple_grants(db: Session = Depends(get_db)):
     """Seed the database with a simple set of diverse grants for testing."""
-    db = next(get_db())
-    
-    # Check if grants already exist
-    existing_count = db.query(Grant).count()
-    if existing_count > 0:
+    # Check if grants already exist; EXISTS stops at the first row, so only
+    # pay for a full count when we actually report it
+    if db.execute(select(exists().select_from(Grant))).scalar():
+        existing_count = db.query(Grant).count()
         return {
             "message": f"Database already has {existing_count} grants. Use /clear first to reset.",
             "existing_grants": existing_count
         }
     
-    sample_grants = [
-        # MEDIA SECTOR
-        {
-            "title": "Digital Media Innovation Fund",
-            "description": "Supporting innovative digital media projects that push creative boundaries and engage new audiences through technology.",
-            "source": "Creative Australia",
-            "source_url": "https://creative.gov.au",
-            "application_url": "https://creative.gov.au/apply",
-            "contact_email": "grants@creative.gov.au",
-            "min_amount": 50000,
-            "max_amount": 200000,
-            "open_date": datetime.now(),
-            "deadline": datetime.now() + timedelta(days=45),
-            "industry_focus": "technology",
-            "location_eligibility": "National",
-            "org_type_eligible": ["Startup", "SME", "Nonprofit"],
-            "funding_purpose": ["Digital Media", "Innovation"],
-            "audience_tags": ["Digital Creators", "Tech Startups"],
-            "status": "open",
-            "notes": "Focus on digital storytelling"
-        },
-        {
-            "title": "Indigenous Film Production Grant",
-            "description": "Supporting Indigenous filmmakers to tell authentic stories and preserve cultural heritage through film.",
-            "source": "Screen Australia",
-            "source_url": "https://screenaustralia.gov.au",
-            "application_url": "https://screenaustralia.gov.au/indigenous",
-            "contact_email": "indigenous@screenaustralia.gov.au",
-            "min_amount": 25000,
-            "max_amount": 150000,
-            "open_date": datetime.now(),
-            "deadline": datetime.now() + timedelta(days=30),
-            "industry_focus": "services",
-            "location_eligibility": "National",
-            "org_type_eligible": ["Indigenous Business", "Nonprofit"],
-            "funding_purpose": ["Film Production", "Cultural Preservation"],
-            "audience_tags": ["Indigenous Communities", "Filmmakers"],
-            "status": "open",
-            "notes": "Priority for Indigenous-owned companies"
-        },
-        
-        # COMMUNITY SECTOR
-        {
-            "title": "Youth Mental Health Initiative",
-            "description": "Supporting community organizations to provide mental health services and support programs for young people.",
-            "source": "Department of Health",
-            "source_url": "https://health.gov.au",
-            "application_url": "https://health.gov.au/youth-mental-health",
-            "contact_email": "youth.health@health.gov.au",
-            "min_amount": 50000,
-            "max_amount": 500000,
-            "open_date": datetime.now(),
-            "deadline": datetime.now() + timedelta(days=75),
-            "industry_focus": "healthcare",
-            "location_eligibility": "National",
-            "org_type_eligible": ["Nonprofit", "Healthcare Provider"],
-            "funding_purpose": ["Mental Health", "Youth Services"],
-            "audience_tags": ["Youth", "Mental Health Professionals"],
-            "status": "open",
-            "notes": "Priority for evidence-based programs"
-        },
-        {
-            "title": "Social Enterprise Accelerator",
-            "description": "Supporting social enterprises to scale their impact and create sustainable business models.",
-            "source": "Social Traders",
-            "source_url": "https://socialtraders.com.au",
-            "application_url": "https://socialtraders.com.au/accelerator",
-            "contact_email": "accelerator@socialtraders.com.au",
-            "min_amount": 25000,
-            "max_amount": 150000,
-            "open_date": datetime.now(),
-            "deadline": datetime.now() + timedelta(days=30),
-            "industry_focus": "services",
-            "location_eligibility": "National",
-            "org_type_eligible": ["Social Enterprise", "Nonprofit"],
-            "funding_purpose": ["Social Enterprise", "Business Development"],
-            "audience_tags": ["Social Entrepreneurs", "Nonprofits"],
-            "status": "open",
-            "notes": "Must have proven social impact model"
-        },
-        
-        # SUSTAINABILITY SECTOR
-        {
-            "title": "Renewable Energy Innovation Grant",
-            "description": "Supporting innovative renewable energy projects that can accelerate Australia's transition to clean energy.",
-            "source": "Australian Renewable Energy Agency",
-            "source_url": "https://arena.gov.au",
-            "application_url": "https://arena.gov.au/innovation",
-            "contact_email": "innovation@arena.gov.au",
-            "min_amount": 100000,
-            "max_amount": 2000000,
-            "open_date": datetime.now(),
-            "deadline": datetime.now() + timedelta(days=120),
-            "industry_focus": "technology",
-            "location_eligibility": "National",
-            "org_type_eligible": ["Startup", "SME", "Research Institution"],
-            "funding_purpose": ["Renewable Energy", "Innovation"],
-            "audience_tags": ["Energy Companies", "Researchers"],
-            "status": "open",
-            "notes": "Must demonstrate commercial potential"
-        },
-        {
-            "title": "Circular Economy Solutions",
-            "description": "Supporting businesses to develop circular economy solutions that reduce waste and create sustainable value chains.",
-            "source": "Circular Economy Australia",
-            "source_url": "https://circulareconomy.org.au",
-            "application_url": "https://circulareconomy.org.au/solutions-fund",
-            "contact_email": "solutions@circulareconomy.org.au",
-            "min_amount": 25000,
-            "max_amount": 300000,
-            "open_date": datetime.now(),
-            "deadline": datetime.now() + timedelta(days=75),
-            "industry_focus": "manufacturing",
-            "location_eligibility": "National",
-            "org_type_eligible": ["Startup", "SME", "Nonprofit"],
-            "funding_purpose": ["Circular Economy", "Waste Reduction"],
-            "audience_tags": ["Manufacturers", "Sustainability Experts"],
-            "status": "open",
-            "notes": "Focus on scalable circular economy models"
-        },
-        {
-            "title": "Sustainable Agriculture Innovation",
-            "description": "Supporting farmers to adopt sustainable practices and reduce environmental impact.",
-            "source": "Department of Agriculture",
-            "source_url": "https://agriculture.gov.au",
-            "application_url": "https://agriculture.gov.au/sustainable-ag",
-            "contact_email": "sustainable.ag@agriculture.gov.au",
-            "min_amount": 50000,
-            "max_amount": 500000,
-            "open_date": datetime.now(),
-            "deadline": datetime.now() + timedelta(days=90),
-            "industry_focus": "agriculture",
-            "location_eligibility": "Regional",
-            "org_type_eligible": ["SME", "Farmer", "Research Institution"],
-            "funding_purpose": ["Sustainable Agriculture", "Innovation"],
-            "audience_tags": ["Farmers", "Agricultural Researchers"],
-            "status": "active",
-            "notes": "Must demonstrate environmental benefits"
-        },
-        {
-            "title": "Marine Conservation Initiative",
-            "description": "Supporting marine conservation projects that protect Australia's unique marine ecosystems.",
-            "source": "Great Barrier Reef Foundation",
-            "source_url": "https://barrierreef.org",
-            "application_url": "https://barrierreef.org/conservation",
-            "contact_email": "conservation@barrierreef.org",
-            "min_amount": 25000,
-            "max_amount": 250000,
-            "open_date": datetime.now(),
-            "deadline": datetime.now() + timedelta(days=45),
-            "industry_focus": "environment",
-            "location_eligibility": "Coastal",
-            "org_type_eligible": ["Nonprofit", "Research Institution"],
-            "funding_purpose": ["Marine Conservation", "Biodiversity"],
-            "audience_tags": ["Marine Biologists", "Conservationists"],
-            "status": "open",
-            "notes": "Priority for Great Barrier Reef projects"
-        }
-    ]
+    now = datetime.now()
+    sample_grants = []
+    for template in SAMPLE_GRANT_TEMPLATES:
+        grant_data = dict(template)
+        grant_data["open_date"] = now
+        grant_data["deadline"] = now + timedelta(days=grant_data.pop("deadline_days"))
+        sample_grants.append(grant_data)
     
-    try:
-        for grant_data in sample_grants:
-            grant = Grant(**grant_data)
-            db.add(grant)
-        
-        db.commit()
-        return {
-            "message": f"Successfully seeded {len(sample_grants)} diverse grants across Media, Community Impact, and Sustainability sectors",
-            "grants_added": len(sample_grants),
-            "sectors": ["Media & Creative", "Community & Social Impact", "Sustainability & Environment"],
-            "note": "Simple test dataset with 8 grants for comprehensive testing"
-        }
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Error seeding grants: {str(e)}")
-    finally:
-        db.close() 
\ No newline at end of file
+    # One Core executemany INSERT against the table, bypassing the ORM bulk
+    # path; org types are already lowercase since this skips model validators
+    db.execute(Grant.__table__.insert(), sample_grants)
+    db.commit()
+    _invalidate_grant_caches()
+    return {
+        "message": f"Successfully seeded {len(sample_grants)} diverse grants across Media, Community Impact, and Sustainability sectors",
+        "grants_added": len(sample_grants),
+        "sectors": ["Media & Creative", "Community & Social Impact", "Sustainability & Environment"],
+        "note": "Simple test dataset with 8 grants for comprehensive testing"
+    } 
\ No newline at end of file
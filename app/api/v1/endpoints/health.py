@@ -1,15 +1,32 @@
 """Health check endpoints for the application."""
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse, Response
+import orjson
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from app.core import deps
-from app.db.session import get_engine
+from app.core.cache import coarse_utc_timestamp
+from app.core.config import settings
+from app.db.session import PING_SQL, get_engine, probe_health
 import logging
 from datetime import datetime
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Constant liveness body, encoded once at import
+LIVE_RESPONSE = orjson.dumps({"status": "ok"})
+
+# Probe statements built once and reused by every request
+_DB_TEST_SQL = text("SELECT 1 AS test, current_database() AS db_name, current_user AS db_user")
+
+@lru_cache(maxsize=1)
+def _safe_db_url(engine) -> str:
+    """Render the engine's URL with the password masked, once per engine."""
+    return engine.url.render_as_string(hide_password=True)
 
 @router.get("/")
 def health_check():
@@ -17,53 +34,62 @@ def health_check():
     return {
         "status": "healthy",
         "database": "connected",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": coarse_utc_timestamp(),
         "environment": "production",
         "version": "1.0.0"
     }
 
-@router.get("/db-test")
+@router.get("/live")
+async def liveness():
+    """Liveness probe: answers as long as the process is serving requests."""
+    return Response(LIVE_RESPONSE, media_type="application/json")
+
+@router.get("/ready")
+async def readiness():
+    """Readiness probe: 503 unless the cached database ping succeeds in time."""
+    if not await probe_health():
+        return ORJSONResponse({"status": "unavailable"}, status_code=503)
+    return {"status": "ready"}
+
 def database_test():
     """Test database connection."""
     try:
         engine = get_engine()
         with engine.connect() as conn:
-            result = conn.execute("SELECT 1 as test")
-            row = result.fetchone()
-            
-            # Get database info
-            db_info = conn.execute("SELECT current_database() as db_name, current_user as db_user")
-            db_row = db_info.fetchone()
+            row = conn.execute(_DB_TEST_SQL).mappings().first()
             
             return {
                 "status": "success",
                 "database": {
-                    "test": row[0],
-                    "database_name": db_row[0],
-                    "user": db_row[1],
-                    "url": str(engine.url).replace(str(engine.url.password), "***") if engine.url.password else str(engine.url)
+                    "test": row["test"],
+                    "database_name": row["db_name"],
+                    "user": row["db_user"],
+                    "url": _safe_db_url(engine)
                 },
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.utcnow()
             }
     except Exception as e:
         logger.error(f"Database test failed: {e}")
         return {
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.utcnow()
         }
 
-@router.get("/session-test")
 def session_test(db: Session = Depends(deps.get_db)):
     """Test database session."""
     try:
-        result = db.execute("SELECT 1 as test")
-        row = result.fetchone()
         return {
             "status": "success",
-            "session_test": row[0],
-            "timestamp": datetime.utcnow().isoformat()
+            "session_test": db.execute(PING_SQL).scalar(),
+            "timestamp": datetime.utcnow()
         }
     except Exception as e:
         logger.error(f"Session test failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+# The diagnostic routes expose connection details and hold a pool connection
+# per call, so they are only registered where explicitly enabled
+if settings.ENABLE_ADMIN_HEALTH_ROUTES:
+    router.add_api_route("/db-test", database_test, methods=["GET"])
+    router.add_api_route("/session-test", session_test, methods=["GET"])
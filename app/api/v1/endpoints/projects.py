@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func
+from sqlalchemy.orm import Session, raiseload
 from typing import List, Optional
 from datetime import datetime
 
@@ -7,44 +9,64 @@ from app.core.deps import get_db  # Use consistent database dependency
 from app.models.project import Project
 from app.db.session import get_last_connection_error
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 @router.get("/")
 async def list_projects(
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
-    status: Optional[str] = None
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=200),
+    status: Optional[str] = None,
+    after_id: Optional[int] = Query(None, ge=0)
 ):
-    """List projects endpoint with proper error handling."""
+    """List projects endpoint with proper error handling.
+
+    Projects are ordered by id. Pass the ``next_cursor`` of a page as
+    ``after_id`` to fetch the next page with an index seek instead of an
+    offset scan; keyset pages do not compute ``total``.
+    """
     try:
-        query = db.query(Project)
+        # The items only use scalar columns, so no relationship may lazy-load
+        query = db.query(Project).options(raiseload("*"))
         
         if status:
             query = query.filter(Project.status == status)
         
-        total = query.count()
-        projects = query.offset(skip).limit(limit).all()
+        if after_id is not None:
+            # Fetch one extra row to learn whether another page follows
+            projects = query.filter(Project.id > after_id).order_by(Project.id).limit(limit + 1).all()
+            has_next = len(projects) > limit
+            projects = projects[:limit]
+            total = None
+        else:
+            # The window count rides along on each row, saving a separate COUNT query
+            rows = query.add_columns(func.count().over()).order_by(Project.id).offset(skip).limit(limit).all()
+            projects = [project for project, _ in rows]
+            total = rows[0][1] if rows else (query.count() if skip else 0)
+            has_next = skip + limit < total
         
-        return {
+        # orjson encodes the datetimes itself; returning the response directly
+        # skips FastAPI's jsonable_encoder pass over every item
+        return ORJSONResponse({
             "items": [
                 {
                     "id": project.id,
                     "name": project.name,
                     "description": project.description,
-                    "created_at": project.created_at.isoformat() if project.created_at else None,
-                    "updated_at": project.updated_at.isoformat() if project.updated_at else None,
+                    "created_at": project.created_at,
+                    "updated_at": project.updated_at,
                     "status": getattr(project, 'status', 'active'),
                     "team_size": getattr(project, 'team_size', 0),
                 }
                 for project in projects
             ],
             "total": total,
-            "page": skip // limit + 1,
+            "page": skip // limit + 1 if after_id is None else None,
             "size": limit,
-            "has_next": skip + limit < total,
-            "has_prev": skip > 0
-        }
+            "has_next": has_next,
+            "has_prev": after_id is not None or skip > 0,
+            "next_cursor": projects[-1].id if has_next else None
+        })
     except Exception as e:
         # Check for database connection issues
         conn_error = get_last_connection_error()
@@ -1,13 +1,30 @@
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, case
+from sqlalchemy import func, desc, case, select
 
 from app.core.deps import get_db
 from app.models.scraper_log import ScraperLog
 from app.schemas.scraper_log import ScraperLog as ScraperLogSchema
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Columns of ScraperLogSchema, read as plain rows for the history endpoint;
+# the counts are coalesced to the schema's default of 0
+SCRAPER_LOG_COLUMNS = (
+    ScraperLog.id,
+    ScraperLog.source_name,
+    ScraperLog.status,
+    func.coalesce(ScraperLog.grants_found, 0).label("grants_found"),
+    func.coalesce(ScraperLog.grants_added, 0).label("grants_added"),
+    func.coalesce(ScraperLog.grants_updated, 0).label("grants_updated"),
+    ScraperLog.error_message,
+    ScraperLog.scraper_metadata.label("scraper_metadata"),
+    ScraperLog.start_time,
+    ScraperLog.end_time,
+    ScraperLog.duration_seconds
+)
 
 @router.get("/status")
 def get_scraper_status(db: Session = Depends(get_db)):
@@ -52,7 +69,9 @@ def run_scrapers(
         "available_sources": ["business_gov", "grantconnect", "australian_grants"]
     }
 
-@router.get("/sources", response_model=List[dict])
+# The rows are built from aggregate columns, so they are returned as an
+# ORJSONResponse directly instead of going through jsonable_encoder
+@router.get("/sources")
 def get_scraper_sources(db: Session = Depends(get_db)):
     """Get status of all scraper sources with their latest run statistics."""
     
@@ -73,7 +92,7 @@ def get_scraper_sources(db: Session = Depends(get_db)):
         .all()
     )
     
-    return [
+    return ORJSONResponse([
         {
             "source_name": log.source_name,
             "status": log.status,
@@ -86,21 +105,20 @@ def get_scraper_sources(db: Session = Depends(get_db)):
             "error_rate": round((log.error_count / log.total_runs) * 100, 2) if log.total_runs > 0 else 0
         }
         for log in latest_logs
-    ]
+    ])
 
-@router.get("/sources/{source_name}/history", response_model=List[ScraperLogSchema])
+@router.get("/sources/{source_name}/history", responses={200: {"model": List[ScraperLogSchema]}})
 def get_source_history(source_name: str, limit: int = 10, db: Session = Depends(get_db)):
     """Get detailed history of a specific scraper source."""
     
-    logs = (
-        db.query(ScraperLog)
-        .filter(ScraperLog.source_name == source_name)
+    logs = db.execute(
+        select(*SCRAPER_LOG_COLUMNS)
+        .where(ScraperLog.source_name == source_name)
         .order_by(desc(ScraperLog.start_time))
         .limit(limit)
-        .all()
-    )
+    ).all()
     
     if not logs:
         raise HTTPException(status_code=404, detail=f"No logs found for source: {source_name}")
     
-    return logs 
\ No newline at end of file
+    return ORJSONResponse([log._asdict() for log in logs]) 
\ No newline at end of file
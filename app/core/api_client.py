@@ -5,6 +5,7 @@ Handles all external API calls with reliability and monitoring
 
 import asyncio
 import aiohttp
+import random
 import requests
 import time
 import logging
@@ -134,7 +135,6 @@ class APIClient:
         delay = min(delay, self.retry_config.max_delay)
         
         if self.retry_config.jitter:
-            import random
             delay = delay * (0.5 + random.random() * 0.5)
         
         return delay
@@ -0,0 +1,57 @@
+"""Small in-process TTL caches for hot read paths."""
+
+import time
+from datetime import datetime
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+# (epoch second, ISO string) of the last timestamp handed out
+_coarse_timestamp: Tuple[int, str] = (0, "")
+
+def coarse_utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string, formatted at most once per second.
+
+    For probe responses that are served many times a second, where a
+    second-granular timestamp is enough.
+    """
+    global _coarse_timestamp
+    second = int(time.time())
+    if _coarse_timestamp[0] != second:
+        _coarse_timestamp = (second, datetime.utcfromtimestamp(second).isoformat())
+    return _coarse_timestamp[1]
+
+def ttl_cache(ttl: float, maxsize: int = 128) -> Callable:
+    """Cache a function's results per argument tuple for ``ttl`` seconds.
+    
+    Meant for diagnostics and aggregates where a few seconds of staleness is
+    acceptable. Exceptions are not cached. The wrapped function gains a
+    ``cache_clear()`` method for explicit invalidation.
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Hashable, Tuple[float, Any]] = {}
+        lock = Lock()
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            entry = cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+            
+            value = func(*args, **kwargs)
+            with lock:
+                if key not in cache and len(cache) >= maxsize:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    cache.pop(next(iter(cache)))
+                cache[key] = (time.monotonic(), value)
+            return value
+        
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    
+    return decorator
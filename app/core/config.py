@@ -56,6 +56,11 @@ class Settings:
     DATABASE_POOL_TIMEOUT: int = int(os.getenv("DATABASE_POOL_TIMEOUT", "60"))
     DATABASE_POOL_RECYCLE: int = int(os.getenv("DATABASE_POOL_RECYCLE", "900"))
     
+    # Health Check Settings
+    HEALTH_PROBE_TIMEOUT_MS: int = int(os.getenv("HEALTH_PROBE_TIMEOUT_MS", "500"))
+    # Diagnostic /health/db-test and /health/session-test routes, off outside development
+    ENABLE_ADMIN_HEALTH_ROUTES: bool = os.getenv("ENABLE_ADMIN_HEALTH_ROUTES", "true" if os.getenv("ENVIRONMENT", "development") == "development" else "false").lower() == "true"
+    
     # CORS Settings - Environment-based configuration
     CORS_ORIGINS: List[str] = []
     CORS_ALLOW_CREDENTIALS: bool = True
@@ -98,6 +103,9 @@ class Settings:
     RATE_LIMIT_REQUESTS_PER_HOUR: int = int(os.getenv("RATE_LIMIT_REQUESTS_PER_HOUR", "10000" if os.getenv("ENVIRONMENT", "development") == "development" else "1000"))
     REDIS_URL: Optional[str] = os.getenv("REDIS_URL")
     
+    # N+1 query detection (development only, requires nplusone from requirements-dev.txt)
+    NPLUSONE_ENABLED: bool = os.getenv("NPLUSONE_ENABLED", "false").lower() == "true"
+    
     # Trusted Hosts (for production)
     TRUSTED_HOSTS: List[str] = [
         "navimpact-api.onrender.com",
@@ -8,58 +8,66 @@ import logging
 from datetime import datetime
 
 from app.core.config import settings
-from app.db.session import get_session_local, get_last_connection_error
+from app.db.session import PING_SQL, get_session_local, get_last_connection_error
 
 logger = logging.getLogger(__name__)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
 def get_db() -> Generator:
-    """Get SQLAlchemy database session with enhanced error handling."""
+    """Get SQLAlchemy database session with enhanced error handling.
+
+    Only failures while opening the session are reported as 503; errors raised
+    by the endpoint (validation, 4xx, query errors) propagate unchanged.
+    """
+    db = None
     try:
-        logger.info("Creating database session...")
-        SessionLocal = get_session_local()
-        logger.info("Session factory created successfully")
-        
-        db = SessionLocal()
-        logger.info("Database session created successfully")
-        
-        # Test the connection using text() for proper SQL execution
         try:
-            logger.info("Testing database connection...")
-            from sqlalchemy import text
-            db.execute(text("SELECT 1"))
-            logger.info("Database connection test successful")
-        except SQLAlchemyError as e:
-            logger.error(f"Database connection test failed: {str(e)}")
-            conn_error = get_last_connection_error()
-            if conn_error:
+            logger.info("Creating database session...")
+            SessionLocal = get_session_local()
+            logger.info("Session factory created successfully")
+            
+            db = SessionLocal()
+            logger.info("Database session created successfully")
+            
+            # Test the connection with the shared ping statement
+            try:
+                logger.info("Testing database connection...")
+                db.execute(PING_SQL)
+                logger.info("Database connection test successful")
+            except SQLAlchemyError as e:
+                logger.error(f"Database connection test failed: {str(e)}")
+                conn_error = get_last_connection_error()
+                if conn_error:
+                    raise HTTPException(
+                        status_code=503,
+                        detail={
+                            "message": "Database connection error",
+                            "error": str(conn_error.get("error")),
+                            "last_attempt": datetime.fromtimestamp(conn_error.get("last_attempt", 0)).isoformat() if conn_error.get("last_attempt") else None,
+                            "attempts": conn_error.get("attempts", 1)
+                        }
+                    )
                 raise HTTPException(
                     status_code=503,
-                    detail={
-                        "message": "Database connection error",
-                        "error": str(conn_error.get("error")),
-                        "last_attempt": datetime.fromtimestamp(conn_error.get("last_attempt", 0)).isoformat() if conn_error.get("last_attempt") else None,
-                        "attempts": conn_error.get("attempts", 1)
-                    }
+                    detail=f"Database connection error: {str(e)}"
                 )
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error creating database session: {str(e)}")
             raise HTTPException(
                 status_code=503,
-                detail=f"Database connection error: {str(e)}"
+                detail="Database service unavailable"
             )
         
         yield db
-    except Exception as e:
-        logger.error(f"Error creating database session: {str(e)}")
-        raise HTTPException(
-            status_code=503,
-            detail="Database service unavailable"
-        )
     finally:
-        try:
-            db.close()
-            logger.info("Database session closed successfully")
-        except Exception as e:
-            logger.warning(f"Error closing database session: {str(e)}")
+        if db is not None:
+            try:
+                db.close()
+                logger.info("Database session closed successfully")
+            except Exception as e:
+                logger.warning(f"Error closing database session: {str(e)}")
 
 async def get_current_user(
     db: Session = Depends(get_db),
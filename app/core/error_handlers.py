@@ -9,7 +9,7 @@ from pydantic import ValidationError
 import logging
 import time
 import traceback
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from collections import deque
 
 from app.core.config import settings
@@ -19,60 +19,69 @@ logger = logging.getLogger(__name__)
 
 # Error tracking with rolling window
 class ErrorStats:
+    """Rolling error counts kept as per-minute buckets.
+
+    Memory and summary cost are bounded by the number of minutes in the window
+    rather than the number of errors, and the most recent error is held as one
+    tuple so readers never see a timestamp paired with another error's type.
+    """
+    
     def __init__(self, window_hours: int = 24):
         self.window_hours = window_hours
-        self.errors = deque()  # [(timestamp, error_type), ...]
-        self.last_cleanup = datetime.now(timezone.utc)
+        self.window_minutes = window_hours * 60
+        self.buckets = deque()  # [(minute, {error_type: count}), ...]
+        self.last_error: Optional[tuple] = None  # (timestamp, error_type)
     
     def add_error(self, error_type: str) -> None:
         """Add an error to the tracking window."""
         current_time = datetime.now(timezone.utc)
-        self.errors.append((current_time, error_type))
+        minute = int(current_time.timestamp() // 60)
+        if not self.buckets or self.buckets[-1][0] != minute:
+            self.buckets.append((minute, {}))
+        counts = self.buckets[-1][1]
+        counts[error_type] = counts.get(error_type, 0) + 1
+        self.last_error = (current_time, error_type)
         self.cleanup_old_errors()
     
     def cleanup_old_errors(self) -> None:
-        """Remove errors outside the rolling window."""
-        current_time = datetime.now(timezone.utc)
-        cutoff_time = current_time - timedelta(hours=self.window_hours)
-        
-        # Only cleanup if it's been at least 1 hour since last cleanup
-        if (current_time - self.last_cleanup) < timedelta(hours=1):
-            return
-            
-        while self.errors and self.errors[0][0] < cutoff_time:
-            self.errors.popleft()
-        
-        self.last_cleanup = current_time
+        """Remove buckets outside the rolling window."""
+        cutoff_minute = int(time.time() // 60) - self.window_minutes
+        while self.buckets and self.buckets[0][0] <= cutoff_minute:
+            self.buckets.popleft()
     
     @property
     def error_count_24h(self) -> int:
         """Get the number of errors in the last 24 hours."""
         self.cleanup_old_errors()
-        return len(self.errors)
+        return sum(sum(counts.values()) for _, counts in self.buckets)
     
     @property
     def last_error_timestamp(self) -> Optional[datetime]:
         """Get the timestamp of the most recent error."""
-        return self.errors[-1][0] if self.errors else None
+        last_error = self.last_error
+        return last_error[0] if last_error else None
     
     @property
     def last_error_type(self) -> Optional[str]:
         """Get the type of the most recent error."""
-        return self.errors[-1][1] if self.errors else None
+        last_error = self.last_error
+        return last_error[1] if last_error else None
     
     def get_error_summary(self) -> Dict[str, Any]:
         """Get a summary of error statistics."""
         self.cleanup_old_errors()
         error_types = {}
-        for _, error_type in self.errors:
-            error_types[error_type] = error_types.get(error_type, 0) + 1
-            
+        for _, counts in self.buckets:
+            for error_type, count in counts.items():
+                error_types[error_type] = error_types.get(error_type, 0) + count
+        
+        last_error = self.last_error or (None, None)
         return {
-            "total_errors": len(self.errors),
+            "total_errors": sum(error_types.values()),
             "error_types": error_types,
             "last_error": {
-                "timestamp": self.last_error_timestamp,
-                "type": self.last_error_type
+                "timestamp": last_error[0],
+                "type": last_error[1]
             }
         }
 
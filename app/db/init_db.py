@@ -1,10 +1,12 @@
 """Database initialization module with enhanced error handling."""
 import logging
+from urllib.parse import urlparse
 from sqlalchemy import text, inspect
 from sqlalchemy.exc import SQLAlchemyError
+from app.core.cache import ttl_cache
 from app.core.config import settings
 from app.db.base import Base
-from app.db.session import get_engine, get_session_local
+from app.db.session import PING_SQL, get_engine, get_session_local
 import time
 
 logger = logging.getLogger(__name__)
@@ -71,10 +73,10 @@ def init_db() -> None:
     
     logger.info("Database initialization completed successfully")
 
+@ttl_cache(ttl=30)
 def get_db_info() -> dict:
     """Get database information without requiring an active connection."""
     try:
-        from urllib.parse import urlparse
         url = settings.DATABASE_URL
         
         # Parse database URL safely
@@ -118,14 +120,14 @@ def get_db_info() -> dict:
             "status": "error"
         }
 
+@ttl_cache(ttl=5)
 def check_db_health() -> bool:
     """Check database health with enhanced error handling."""
     try:
         # Test database connection with a simple query
         engine = get_engine()
         with engine.connect() as conn:
-            result = conn.execute(text("SELECT 1"))
-            result.scalar()
+            conn.execute(PING_SQL).scalar()
             logger.info("Database health check passed")
             return True
     except Exception as e:
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 from threading import Lock
 from sqlalchemy.pool import QueuePool
+from app.core.cache import ttl_cache
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -243,6 +244,7 @@ def initialize_pool_monitor(engine):
     logger.info("Database pool monitor initialized")
     return monitor
 
+@ttl_cache(ttl=5)
 def check_pool_health() -> Dict:
     """Quick health check for the connection pool."""
     monitor = get_pool_monitor()
@@ -1,6 +1,10 @@
+import asyncio
 import os
+from typing import Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
+from app.core.cache import ttl_cache
 from app.core.config import settings
 import logging
 import time
@@ -8,6 +12,9 @@ import time
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Liveness probe shared by the health checks and session setup
+PING_SQL = text("SELECT 1")
+
 # Global engine variable
 _engine = None
 _SessionLocal = None
@@ -16,7 +23,7 @@ _SessionLocal = None
 _last_connection_error = None
 
 def get_engine():
-    """Create SQLAlchemy engine with absolute minimal configuration."""
+    """Create the shared SQLAlchemy engine and its connection pool."""
     global _engine
     
     if _engine is not None:
@@ -32,12 +39,21 @@ def get_engine():
             database_url = "postgresql://alanmccarthy@localhost:5432/navimpact_db"
     
     try:
-        # Create engine with minimal configuration
-        _engine = create_engine(database_url)
+        # Size the pool from settings (also what pool_monitor reports against)
+        # and pre-ping connections so stale ones are replaced, not surfaced as errors
+        engine_kwargs = {"pool_pre_ping": True}
+        if not database_url.startswith("sqlite"):
+            engine_kwargs.update(
+                pool_size=settings.DATABASE_POOL_SIZE,
+                max_overflow=settings.DATABASE_MAX_OVERFLOW,
+                pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+                pool_recycle=settings.DATABASE_POOL_RECYCLE
+            )
+        _engine = create_engine(database_url, **engine_kwargs)
         
         # Test connection
         with _engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+            conn.execute(PING_SQL)
         
         logger.info("Database connection successful")
         return _engine
@@ -80,13 +96,57 @@ def get_db():
     finally:
         db.close()
 
-def health_check():
-    """Check database health."""
+# Seconds a probe result, including a timeout, is reused by probe_health
+HEALTH_PROBE_TTL = 5.0
+
+# The single in-flight probe task and the last (monotonic time, result) recorded
+_probe_task: Optional[asyncio.Task] = None
+_probe_result: Optional[Tuple[float, Optional[bool]]] = None
+
+def _ping_database() -> bool:
+    """Run one SELECT 1 on the shared engine, reporting failure as False."""
     try:
         engine = get_engine()
         with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+            conn.execute(PING_SQL)
         return True
     except Exception as e:
         logger.error(f"Database health check failed: {str(e)}")
-        return False 
\ No newline at end of file
+        return False
+
+@ttl_cache(ttl=5)
+def health_check():
+    """Check database health, cached briefly for synchronous callers."""
+    return _ping_database()
+
+def _record_probe(task: asyncio.Task) -> None:
+    """Store a finished probe's result for the following TTL window."""
+    global _probe_result
+    if task.cancelled():
+        return
+    _probe_result = (time.monotonic(), task.exception() is None and task.result())
+
+async def probe_health(fresh: bool = False) -> Optional[bool]:
+    """Check the database off the event loop, bounded by ``HEALTH_PROBE_TIMEOUT_MS``.
+
+    Concurrent callers share one in-flight probe, so a stalled database holds
+    at most one threadpool worker. Results are reused for ``HEALTH_PROBE_TTL``
+    seconds; a timeout is recorded as ``None`` and reused the same way, while
+    the running probe is left to finish and record the real result. ``fresh``
+    skips the recorded result but still joins a probe that is in flight.
+    """
+    global _probe_task, _probe_result
+    if not fresh and _probe_result is not None and time.monotonic() - _probe_result[0] < HEALTH_PROBE_TTL:
+        return _probe_result[1]
+    
+    loop = asyncio.get_running_loop()
+    task = _probe_task
+    if task is None or task.done() or task.get_loop() is not loop:
+        task = _probe_task = loop.create_task(run_in_threadpool(_ping_database))
+        task.add_done_callback(_record_probe)
+    try:
+        # shield() keeps a caller's timeout from cancelling the shared probe
+        return await asyncio.wait_for(asyncio.shield(task), timeout=settings.HEALTH_PROBE_TIMEOUT_MS / 1000)
+    except asyncio.TimeoutError:
+        _probe_result = (time.monotonic(), None)
+        return None
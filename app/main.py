@@ -3,10 +3,10 @@ NavImpact API - Production Ready
 Enhanced with comprehensive security measures for production deployment.
 """
 
-from datetime import datetime
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from starlette.middleware.sessions import SessionMiddleware
@@ -15,6 +15,7 @@ import time
 import os
 import sys
 import traceback
+import orjson
 
 # Import Base and models
 from app.db.base import Base  # noqa: F401
@@ -29,7 +30,8 @@ from app.models.task_comment import TaskComment  # noqa: F401
 from app.models.time_entry import TimeEntry  # noqa: F401
 
 from app.api.v1.api import api_router
-from app.db.session import get_engine, close_database
+from app.db.session import get_engine, close_database, health_check as check_db_health, probe_health
+from app.core.cache import coarse_utc_timestamp
 from app.core.config import settings
 from app.core.error_handlers import setup_error_handlers
 from app.db.init_db import init_db, get_db_info, validate_database_config
@@ -42,6 +44,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=8)
+def _health_body(database: str, timestamp: str) -> bytes:
+    """Encode the /health payload, reused while the probe result and second are unchanged."""
+    return orjson.dumps({
+        "status": "healthy",
+        "database": database,
+        "timestamp": timestamp,
+        "environment": settings.ENV,
+        "version": "1.0.0"
+    })
+
 # Initialize Sentry for error tracking in production
 if settings.SENTRY_DSN and settings.ENV == 'production':
     try:
@@ -89,6 +102,16 @@ if settings.ENV == 'production' and settings.RATE_LIMIT_ENABLED:
 else:
     logger.info(f"Rate limiting disabled in {settings.ENV} environment")
 
+# N+1 query detection (development only)
+nplusone_profiler = None
+if settings.ENV == 'development' and settings.NPLUSONE_ENABLED:
+    try:
+        import nplusone.ext.sqlalchemy  # noqa: F401 - patches SQLAlchemy loaders
+        from nplusone.core import profiler as nplusone_profiler
+        logger.info("nplusone enabled: N+1 lazy loads will raise")
+    except ImportError:
+        logger.warning("nplusone not installed, N+1 detection disabled")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -121,8 +144,7 @@ async def lifespan(app: FastAPI):
         
         # Check database health
         logger.info("Checking database health...")
-        from app.db.session import health_check
-        if health_check():
+        if check_db_health():
             logger.info("Database health check passed.")
         else:
             logger.warning("Database health check failed.")
@@ -250,9 +272,18 @@ def create_app() -> FastAPI:
         app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
         app.add_middleware(SlowAPIMiddleware)
     
+    # 6. N+1 Query Detection Middleware (development only)
+    if nplusone_profiler:
+        @app.middleware("http")
+        async def nplusone_middleware(request: Request, call_next):
+            """Raise on N+1 lazy loads issued while handling the request."""
+            with nplusone_profiler.Profiler():
+                return await call_next(request)
+    
     # === ROUTES ===
     
-    @app.get("/")
+    # HEAD is accepted so liveness probes can hit "/" without touching the database
+    @app.api_route("/", methods=["GET", "HEAD"])
     async def read_root():
         """Root endpoint with basic information."""
         return {
@@ -262,29 +293,36 @@ def create_app() -> FastAPI:
             "status": "running"
         }
     
-    @app.get("/health")
-    async def health_check():
-        """Health check endpoint."""
+    @app.get("/health", response_class=ORJSONResponse)
+    async def health_check(fresh: bool = False):
+        """Health check endpoint.
+
+        The database probe is cached for a few seconds and concurrent
+        requests share a single in-flight probe, so only one request per
+        window touches the database; ``fresh=1`` skips the cached result
+        (joining a probe already in flight). The probe runs in the
+        threadpool and is abandoned after
+        ``HEALTH_PROBE_TIMEOUT_MS`` so a stalled database cannot push the
+        response past the orchestrator's probe timeout. Orchestrators should
+        prefer ``/api/v1/health/live`` and ``/api/v1/health/ready``.
+        """
         try:
-            # Check database health using the correct function
-            from app.db.session import health_check as check_db_health
-            db_healthy = check_db_health()
+            db_healthy = await probe_health(fresh)
+            if db_healthy is None:
+                database = "timeout"
+            else:
+                database = "connected" if db_healthy else "disconnected"
             
-            return {
-                "status": "healthy",
-                "database": "connected" if db_healthy else "disconnected",
-                "timestamp": datetime.utcnow().isoformat(),
-                "environment": settings.ENV,
-                "version": "1.0.0"
-            }
+            body = _health_body(database, coarse_utc_timestamp())
+            return Response(body, media_type="application/json")
         except Exception as e:
             logger.error(f"Health check failed: {str(e)}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 content={
                     "status": "unhealthy",
                     "error": str(e),
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": coarse_utc_timestamp()
                 }
             )
     
@@ -1,12 +1,19 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, Numeric, JSON, ForeignKey, func
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, Text, Numeric, JSON, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, validates
 from app.db.base_class import Base
 
 class Grant(Base):
     """Grant model for tracking funding opportunities."""
     
     __tablename__ = "grants"
+    __table_args__ = (
+        # GIN index backing the "?" key-existence filter on org_type_eligible
+        Index("ix_grants_org_type_eligible", "org_type_eligible", postgresql_using="gin"),
+        # Composite index for the list endpoint's combined filters, led by status
+        Index("ix_grants_filters", "status", "industry_focus", "location_eligibility"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(500), nullable=False)
@@ -29,7 +36,7 @@ class Grant(Base):
     # Categorization
     industry_focus = Column(String(100), nullable=True, index=True)
     location_eligibility = Column(String(100), nullable=True, index=True)
-    org_type_eligible = Column(JSON, nullable=True, default=list)
+    org_type_eligible = Column(JSON().with_variant(JSONB, "postgresql"), nullable=True, default=list)
     funding_purpose = Column(JSON, nullable=True, default=list)
     audience_tags = Column(JSON, nullable=True, default=list)
     
@@ -44,6 +51,13 @@ class Grant(Base):
     # Many-to-many relationship with tags
     # tags = relationship("Tag", secondary="grant_tags", back_populates="grants")  # Temporarily disabled
     
+    @validates("org_type_eligible")
+    def normalize_org_types(self, key, value):
+        """Store organization types lowercased so filters can match them exactly."""
+        if value:
+            return [org_type.lower() for org_type in value]
+        return value
+    
     def __repr__(self):
         return f"<Grant {self.title}>"
     
@@ -61,11 +61,12 @@ class GrantFilters(BaseModel):
 class GrantList(BaseModel):
     """Schema for paginated grant list."""
     items: List[GrantResponse]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     size: int
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
 
 class ProjectProfile(BaseModel):
     """Schema for project profile used in grant matching."""
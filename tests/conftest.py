@@ -171,4 +171,15 @@ def test_task(db, test_user, test_project):
     db.add(task)
     db.commit()
     db.refresh(task)
-    return task
\ No newline at end of file
+    return task
+@pytest.fixture
+def executed_statements():
+    """SQL statements run on any engine while the test is active; clear() it before measuring."""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(Engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(Engine, "before_cursor_execute", record)
@@ -0,0 +1,72 @@
+from unittest.mock import patch
+from app.core.cache import coarse_utc_timestamp, ttl_cache
+
+def test_ttl_cache_reuses_value_within_ttl():
+    calls = []
+    
+    @ttl_cache(ttl=5)
+    def compute(x):
+        calls.append(x)
+        return x * 2
+    
+    with patch("app.core.cache.time.monotonic", return_value=100.0):
+        assert compute(2) == 4
+        assert compute(2) == 4
+    assert calls == [2]
+
+def test_ttl_cache_expires_after_ttl():
+    calls = []
+    
+    @ttl_cache(ttl=5)
+    def compute(x):
+        calls.append(x)
+        return x * 2
+    
+    with patch("app.core.cache.time.monotonic", return_value=100.0):
+        compute(2)
+    with patch("app.core.cache.time.monotonic", return_value=106.0):
+        compute(2)
+    assert calls == [2, 2]
+
+def test_ttl_cache_keys_on_arguments_and_evicts_oldest():
+    calls = []
+    
+    @ttl_cache(ttl=60, maxsize=2)
+    def compute(x):
+        calls.append(x)
+        return x
+    
+    compute(1)
+    compute(2)
+    compute(3)  # evicts 1
+    compute(2)
+    compute(1)
+    assert calls == [1, 2, 3, 1]
+
+def test_ttl_cache_does_not_cache_exceptions_and_can_be_cleared():
+    calls = []
+    
+    @ttl_cache(ttl=60)
+    def compute():
+        calls.append(None)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return "ok"
+    
+    try:
+        compute()
+    except RuntimeError:
+        pass
+    assert compute() == "ok"
+    assert compute() == "ok"
+    compute.cache_clear()
+    compute()
+    assert len(calls) == 3
+
+def test_coarse_utc_timestamp_changes_once_per_second():
+    with patch("app.core.cache.time.time", return_value=1700000000.2):
+        first = coarse_utc_timestamp()
+    with patch("app.core.cache.time.time", return_value=1700000000.9):
+        assert coarse_utc_timestamp() is first
+    with patch("app.core.cache.time.time", return_value=1700000001.0):
+        assert coarse_utc_timestamp() == "2023-11-14T22:13:21"
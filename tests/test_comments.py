@@ -232,4 +232,39 @@ def test_multiple_reactions(authorized_client: TestClient, db: Session, test_use
     ).all()
     assert len(reactions) == len(emojis)
     reaction_emojis = [r.emoji for r in reactions]
-    assert all(emoji in reaction_emojis for emoji in emojis) 
\ No newline at end of file
+    assert all(emoji in reaction_emojis for emoji in emojis) 
+def test_get_task_comments_query_count_is_constant(
+    authorized_client: TestClient, db: Session, test_user, test_user2, test_task, executed_statements
+):
+    """Reactions are eager-loaded, so more comments don't mean more queries."""
+    def add_comments(count):
+        comments = [
+            TaskComment(content=f"Comment {i}", task_id=test_task.id, user_id=test_user.id)
+            for i in range(count)
+        ]
+        db.add_all(comments)
+        db.flush()
+        for comment in comments:
+            db.add_all([
+                Reaction(comment_id=comment.id, user_id=test_user.id, emoji="👍"),
+                Reaction(comment_id=comment.id, user_id=test_user2.id, emoji="👍"),
+                Reaction(comment_id=comment.id, user_id=test_user2.id, emoji="🎉")
+            ])
+        db.commit()
+    
+    def fetch():
+        executed_statements.clear()
+        response = authorized_client.get(f"/api/v1/comments/task/{test_task.id}")
+        assert response.status_code == 200
+        return response.json(), len(executed_statements)
+    
+    add_comments(2)
+    data, queries_for_two = fetch()
+    assert len(data) == 2
+    for comment in data:
+        assert comment["reactions"] == {"👍": [test_user.id, test_user2.id], "🎉": [test_user2.id]}
+    
+    add_comments(3)
+    data, queries_for_five = fetch()
+    assert len(data) == 5
+    assert queries_for_five == queries_for_two
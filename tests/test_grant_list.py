@@ -0,0 +1,142 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.api.v1.endpoints.grants import _invalidate_grant_caches
+from app.models.grant import Grant
+
+@pytest.fixture
+def grants(db: Session):
+    """Create grants that differ in every list filter."""
+    grants = [
+        Grant(
+            title="Tech Grant",
+            source="Business Gov",
+            industry_focus="technology",
+            location_eligibility="national",
+            org_type_eligible=["sme", "startup"],
+            status="open"
+        ),
+        Grant(
+            title="Health Grant",
+            source="GrantConnect",
+            industry_focus="healthcare",
+            location_eligibility="state",
+            org_type_eligible=["nonprofit"],
+            status="closed"
+        ),
+        Grant(
+            title="Education Grant",
+            source="GrantConnect",
+            industry_focus="education",
+            location_eligibility="regional",
+            org_type_eligible=["academic", "nonprofit"],
+            status="open"
+        )
+    ]
+    db.add_all(grants)
+    db.commit()
+    # The list endpoints cache pages and counts; rows written through the ORM bypass their invalidation
+    _invalidate_grant_caches()
+    yield grants
+    _invalidate_grant_caches()
+
+def _titles(response) -> set:
+    assert response.status_code == 200
+    return {item["title"] for item in response.json()["items"]}
+
+def test_filter_by_org_type(client: TestClient, grants):
+    """org_type matches an element of the JSONB eligibility array."""
+    response = client.get("/api/v1/grants/?org_type=nonprofit")
+    assert _titles(response) == {"Health Grant", "Education Grant"}
+
+    response = client.get("/api/v1/grants/?org_type=sme&include_total=true")
+    assert _titles(response) == {"Tech Grant"}
+    assert response.json()["total"] == 1
+
+def test_export_filters_by_org_type(client: TestClient, grants):
+    """The export stream applies the same org_type filter."""
+    response = client.get("/api/v1/grants/export?org_type=startup")
+    assert response.status_code == 200
+    assert [grant["title"] for grant in response.json()] == ["Tech Grant"]
+
+def test_list_grants_honours_if_none_match(client: TestClient, grants):
+    """A repeat request with the page's ETag gets an empty 304."""
+    first = client.get("/api/v1/grants/?limit=50")
+    etag = first.headers["ETag"]
+    
+    second = client.get("/api/v1/grants/?limit=50", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+def test_grant_sources_honours_if_none_match(client: TestClient):
+    """The static sources response carries a fixed ETag."""
+    etag = client.get("/api/v1/grants/sources").headers["ETag"]
+    response = client.get("/api/v1/grants/sources", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+def test_fields_subset_returns_empty_lists_for_null_arrays(client: TestClient, db: Session):
+    """Array columns come back as [] whether or not fields= is given."""
+    db.add(Grant(title="Bare Grant", source="Test", status="open", audience_tags=None))
+    db.commit()
+    _invalidate_grant_caches()
+    
+    full = client.get("/api/v1/grants/").json()["items"][0]
+    subset = client.get("/api/v1/grants/?fields=title,audience_tags").json()["items"][0]
+    assert full["audience_tags"] == []
+    assert subset == {"id": full["id"], "title": "Bare Grant", "audience_tags": []}
+    _invalidate_grant_caches()
+
+@pytest.mark.parametrize("query, expected", [
+    ("source=GrantConnect", {"Health Grant", "Education Grant"}),
+    ("industry_focus=technology", {"Tech Grant"}),
+    ("location=state", {"Health Grant"}),
+    ("status=open", {"Tech Grant", "Education Grant"}),
+    ("source=GrantConnect&status=open&org_type=academic", {"Education Grant"})
+])
+def test_list_filters(client: TestClient, grants, query, expected):
+    """Each list filter, alone and combined, narrows the page and the total."""
+    response = client.get(f"/api/v1/grants/?{query}&include_total=true")
+    assert _titles(response) == expected
+    assert response.json()["total"] == len(expected)
+
+def test_list_rejects_unknown_filter_value(client: TestClient, grants):
+    """Literal-typed filters reject values outside the allowed set."""
+    assert client.get("/api/v1/grants/?status=pending").status_code == 422
+
+def test_list_is_newest_first(client: TestClient, grants):
+    """Grants are ordered by id, newest first."""
+    ids = [item["id"] for item in client.get("/api/v1/grants/").json()["items"]]
+    assert ids == sorted((grant.id for grant in grants), reverse=True)
+
+def test_cursor_pagination_walks_every_grant(client: TestClient, grants):
+    """Following next_cursor visits each grant once, then stops."""
+    response = client.get("/api/v1/grants/?limit=2").json()
+    assert response["has_next"] is True
+    assert response["has_prev"] is False
+    seen = [item["id"] for item in response["items"]]
+    
+    response = client.get(f"/api/v1/grants/?limit=2&cursor={response['next_cursor']}").json()
+    seen += [item["id"] for item in response["items"]]
+    assert response["has_next"] is False
+    assert response["has_prev"] is True
+    assert response["next_cursor"] is None
+    assert response["page"] is None
+    
+    assert seen == sorted((grant.id for grant in grants), reverse=True)
+
+def test_invalid_cursor_is_rejected(client: TestClient, grants):
+    """A cursor that doesn't decode to a grant id is a 400, not a 500."""
+    response = client.get("/api/v1/grants/?cursor=not-a-cursor")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+def test_unknown_field_is_rejected(client: TestClient, grants):
+    """fields= only accepts grant list columns."""
+    assert client.get("/api/v1/grants/?fields=title,password").status_code == 400
+
+def test_count_grants(client: TestClient, grants):
+    """/count is exact for a small or never-analyzed table, where the planner estimate is unreliable."""
+    response = client.get("/api/v1/grants/count")
+    assert response.status_code == 200
+    assert response.json()["total"] == len(grants)
@@ -0,0 +1,50 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.api.v1.endpoints.grants import _invalidate_grant_caches
+from app.models.grant import Grant
+
+def _add_grants(db: Session, count: int) -> list:
+    grants = [
+        Grant(
+            title=f"Test Grant {i}",
+            source="Test Foundation",
+            status="open",
+            org_type_eligible=["nonprofit"]
+        )
+        for i in range(count)
+    ]
+    db.add_all(grants)
+    db.commit()
+    # Rows written through the ORM bypass the list endpoint's page cache invalidation
+    _invalidate_grant_caches()
+    return grants
+
+@pytest.fixture
+def sample_grants(db: Session):
+    """Create a page's worth of grants."""
+    grants = _add_grants(db, 5)
+    yield grants
+    _invalidate_grant_caches()
+
+def test_list_grants_query_count_is_constant(client: TestClient, db: Session, sample_grants, executed_statements):
+    """A grant page is one query however many rows it holds, and cached pages run none."""
+    def fetch():
+        executed_statements.clear()
+        response = client.get("/api/v1/grants/?limit=50")
+        assert response.status_code == 200
+        return len(response.json()["items"]), len(executed_statements)
+
+    assert fetch() == (5, 1)
+    assert fetch() == (5, 0)
+
+    _add_grants(db, 10)
+    assert fetch() == (15, 1)
+
+def test_grant_sources_runs_no_queries(client: TestClient, executed_statements):
+    """The sources endpoint serves a static body."""
+    executed_statements.clear()
+    response = client.get("/api/v1/grants/sources")
+
+    assert response.status_code == 200
+    assert executed_statements == []
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import pytest
+from fastapi.testclient import TestClient
+from app.core.config import settings
+from app.db import session as db_session
+
+@pytest.fixture(autouse=True)
+def reset_probe_state(monkeypatch):
+    """Start each test without a recorded or in-flight database probe."""
+    monkeypatch.setattr(db_session, "_probe_task", None)
+    monkeypatch.setattr(db_session, "_probe_result", None)
+
+def test_liveness_does_not_need_the_database(client: TestClient, monkeypatch):
+    """/health/live answers even when the database probe would fail."""
+    monkeypatch.setattr(db_session, "_ping_database", lambda: False)
+    response = client.get("/api/v1/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+def test_readiness_reports_a_healthy_database(client: TestClient):
+    """/health/ready is 200 while the database answers."""
+    response = client.get("/api/v1/health/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready"}
+
+def test_readiness_fails_without_the_database(client: TestClient, monkeypatch):
+    """/health/ready is 503 when the database probe fails."""
+    monkeypatch.setattr(db_session, "_ping_database", lambda: False)
+    response = client.get("/api/v1/health/ready")
+    assert response.status_code == 503
+    assert response.json() == {"status": "unavailable"}
+
+def test_stalled_database_holds_one_probe_thread(monkeypatch):
+    """Timed-out probes share the one running check instead of each starting a thread."""
+    release = threading.Event()
+    threads = []
+    
+    def stalled_ping():
+        threads.append(threading.get_ident())
+        release.wait(5)
+        return True
+    
+    monkeypatch.setattr(db_session, "_ping_database", stalled_ping)
+    monkeypatch.setattr(settings, "HEALTH_PROBE_TIMEOUT_MS", 50)
+    
+    async def probe_in_waves():
+        first = await asyncio.gather(*(db_session.probe_health() for _ in range(20)))
+        # The timeout is cached for the TTL window
+        cached = await db_session.probe_health()
+        # Past the window, callers join the check that is still running
+        monkeypatch.setattr(db_session, "HEALTH_PROBE_TTL", 0)
+        second = await asyncio.gather(*(db_session.probe_health() for _ in range(20)))
+        release.set()
+        await db_session._probe_task
+        return first + [cached] + second
+    
+    assert asyncio.run(probe_in_waves()) == [None] * 41
+    assert len(threads) == 1
+
+def test_concurrent_cache_misses_make_one_database_call(monkeypatch):
+    """N callers missing the cache at once, fresh or not, run a single SELECT 1."""
+    calls = []
+    
+    def slow_ping():
+        calls.append(1)
+        threading.Event().wait(0.05)
+        return True
+    
+    monkeypatch.setattr(db_session, "_ping_database", slow_ping)
+    
+    async def probe_concurrently(fresh):
+        return await asyncio.gather(*(db_session.probe_health(fresh) for _ in range(20)))
+    
+    assert asyncio.run(probe_concurrently(False)) == [True] * 20
+    assert len(calls) == 1
+    
+    # Within the TTL the recorded result is reused without a call
+    assert asyncio.run(probe_concurrently(False)) == [True] * 20
+    assert len(calls) == 1
+    
+    # fresh skips the recorded result, but concurrent fresh callers still share one call
+    assert asyncio.run(probe_concurrently(True)) == [True] * 20
+    assert len(calls) == 2
+
+def test_health_fresh_refreshes_the_probe(client: TestClient, monkeypatch):
+    """/health?fresh=1 re-runs the probe that plain /health serves from cache."""
+    calls = []
+    monkeypatch.setattr(db_session, "_ping_database", lambda: calls.append(1) or True)
+    
+    assert client.get("/health").json()["database"] == "connected"
+    assert client.get("/health").json()["database"] == "connected"
+    assert len(calls) == 1
+    assert client.get("/health?fresh=1").json()["database"] == "connected"
+    assert len(calls) == 2
@@ -0,0 +1,85 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.models.project import Project
+
+@pytest.fixture
+def projects(db: Session, test_user):
+    """Create five projects, three of them active."""
+    projects = [
+        Project(
+            name=f"Project {i}",
+            status="active" if i % 2 == 0 else "planning",
+            owner_id=test_user.id
+        )
+        for i in range(5)
+    ]
+    db.add_all(projects)
+    db.commit()
+    return projects
+
+def _ids(response) -> list:
+    assert response.status_code == 200
+    return [item["id"] for item in response.json()["items"]]
+
+def test_offset_page_reports_window_total(client: TestClient, projects):
+    """The total comes from the page query and honours the status filter."""
+    response = client.get("/api/v1/projects/?limit=2")
+    assert _ids(response) == [project.id for project in projects[:2]]
+    data = response.json()
+    assert data["total"] == 5
+    assert data["page"] == 1
+    assert data["has_next"] is True
+    assert data["has_prev"] is False
+    assert data["next_cursor"] == projects[1].id
+
+    response = client.get("/api/v1/projects/?status=active&limit=2&skip=2")
+    assert _ids(response) == [projects[4].id]
+    assert response.json()["total"] == 3
+    assert response.json()["has_next"] is False
+
+def test_offset_past_the_end_still_reports_total(client: TestClient, projects):
+    """An empty offset page falls back to a COUNT for the total."""
+    response = client.get("/api/v1/projects/?skip=10&limit=2")
+    assert _ids(response) == []
+    data = response.json()
+    assert data["total"] == 5
+    assert data["has_next"] is False
+    assert data["has_prev"] is True
+
+def test_keyset_pages_walk_every_project(client: TestClient, projects):
+    """Following next_cursor as after_id visits each project once, in id order."""
+    seen = []
+    response = client.get("/api/v1/projects/?limit=2&after_id=0").json()
+    pages = 0
+    while True:
+        pages += 1
+        seen += [item["id"] for item in response["items"]]
+        assert response["total"] is None
+        assert response["page"] is None
+        assert response["has_prev"] is True
+        if not response["has_next"]:
+            assert response["next_cursor"] is None
+            break
+        assert response["next_cursor"] == seen[-1]
+        response = client.get(f"/api/v1/projects/?limit=2&after_id={response['next_cursor']}").json()
+
+    assert pages == 3
+    assert seen == [project.id for project in projects]
+
+@pytest.mark.parametrize("query", ["limit=0", "limit=0&after_id=1", "limit=201", "skip=-1", "after_id=-1"])
+def test_invalid_paging_is_rejected(client: TestClient, query):
+    """Out-of-range paging parameters are a 422, not a 500."""
+    assert client.get(f"/api/v1/projects/?{query}").status_code == 422
+
+def test_list_projects_query_count_is_constant(client: TestClient, db: Session, test_user, projects, executed_statements):
+    """Listing projects never lazy-loads a relationship per row."""
+    def fetch():
+        executed_statements.clear()
+        assert client.get("/api/v1/projects/").status_code == 200
+        return len(executed_statements)
+    
+    queries_for_five = fetch()
+    db.add_all(Project(name=f"Extra {i}", status="active", owner_id=test_user.id) for i in range(5))
+    db.commit()
+    assert fetch() == queries_for_five
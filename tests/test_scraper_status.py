@@ -0,0 +1,84 @@
+from datetime import datetime
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.models.scraper_log import ScraperLog
+
+# Keys of app.schemas.scraper_log.ScraperLog, the history endpoint's documented model
+SCRAPER_LOG_KEYS = {
+    "id", "source_name", "status", "grants_found", "grants_added", "grants_updated",
+    "error_message", "scraper_metadata", "start_time", "end_time", "duration_seconds"
+}
+
+@pytest.fixture
+def scraper_logs(db: Session):
+    """Two runs of one source, the older one failed with NULL counts."""
+    logs = [
+        ScraperLog(
+            source_name="grantconnect",
+            status="error",
+            duration_seconds=4,
+            grants_found=None,
+            grants_added=None,
+            grants_updated=None,
+            error_message="timeout"
+        ),
+        ScraperLog(
+            source_name="grantconnect",
+            status="success",
+            end_time=datetime(2024, 1, 2, 9, 31),
+            duration_seconds=60,
+            grants_found=10,
+            grants_added=4,
+            grants_updated=2,
+            scraper_metadata={"pages": 3}
+        )
+    ]
+    # ScraperLog.__init__ stamps start_time with the current time
+    logs[0].start_time = datetime(2024, 1, 1, 9, 30, 0, 123456)
+    logs[1].start_time = datetime(2024, 1, 2, 9, 30)
+    db.add_all(logs)
+    db.commit()
+    return logs
+
+def test_source_history_matches_schema(client: TestClient, scraper_logs):
+    """History rows carry the schema's keys, newest first, with ISO datetimes."""
+    response = client.get("/api/v1/scraper/sources/grantconnect/history")
+    assert response.status_code == 200
+    newest, oldest = response.json()
+    
+    assert set(newest) == SCRAPER_LOG_KEYS
+    assert newest["start_time"] == "2024-01-02T09:30:00"
+    assert newest["end_time"] == "2024-01-02T09:31:00"
+    assert newest["scraper_metadata"] == {"pages": 3}
+    assert (newest["grants_found"], newest["grants_added"], newest["grants_updated"]) == (10, 4, 2)
+    
+    assert oldest["start_time"] == "2024-01-01T09:30:00.123456"
+    assert oldest["end_time"] is None
+    # NULL counts get the schema default instead of null
+    assert (oldest["grants_found"], oldest["grants_added"], oldest["grants_updated"]) == (0, 0, 0)
+
+def test_source_history_limit(client: TestClient, scraper_logs):
+    response = client.get("/api/v1/scraper/sources/grantconnect/history?limit=1")
+    assert [log["status"] for log in response.json()] == ["success"]
+
+def test_source_history_unknown_source(client: TestClient, scraper_logs):
+    response = client.get("/api/v1/scraper/sources/nowhere/history")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "No logs found for source: nowhere"
+
+def test_scraper_sources_summary(client: TestClient, scraper_logs):
+    """/sources aggregates each source's runs."""
+    response = client.get("/api/v1/scraper/sources")
+    assert response.status_code == 200
+    (source,) = response.json()
+    assert set(source) == {
+        "source_name", "status", "last_run", "avg_duration_seconds", "total_grants_found",
+        "total_grants_added", "total_grants_updated", "total_runs", "error_rate"
+    }
+    assert source["source_name"] == "grantconnect"
+    assert source["last_run"] == "2024-01-02T09:30:00"
+    assert source["avg_duration_seconds"] == 32.0
+    assert source["total_grants_found"] == 10
+    assert source["total_runs"] == 2
+    assert source["error_rate"] == 50.0